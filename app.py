@@ -1,7 +1,18 @@
+import pandas as pd
 import streamlit as st
 from datetime import datetime, date
+from itertools import islice
 from pawpal_system import Owner, Pet, Task, PawPalSystem
 
+# Cap on conflict warnings rendered under Today's Schedule
+MAX_CONFLICTS_SHOWN = 10
+
+
+def format_datetime(dt):
+    """Format dt as 'YYYY-MM-DD HH:MM' (f-string int formatting beats strftime)."""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+
+
 # Initialize persistent system in session_state
 if "system" not in st.session_state:
     st.session_state.system = PawPalSystem()
@@ -151,7 +162,7 @@ else:
                 priority=int(priority),
             )
             st.session_state.system.schedule_task(st.session_state.owner.name, pet_name, task)
-            st.success(f"Scheduled: {title} for {pet_name} at {due_dt.strftime('%Y-%m-%d %H:%M')}")
+            st.success(f"Scheduled: {title} for {pet_name} at {format_datetime(due_dt)}")
         except Exception as e:
             st.error(str(e))
 st.header("Today's Schedule")
@@ -168,25 +179,26 @@ else:
         # fallback
         sorted_tasks = tasks_today
 
-    # Build table rows
-    rows = []
-    for t in sorted_tasks:
-        status_value = getattr(t.status, "value", str(t.status))
-        time_str = t.due_datetime.strftime('%H:%M') if t.due_datetime is not None else "--:--"
-        rows.append({"title": t.title, "time": time_str, "priority": t.priority, "status": status_value})
-
-    st.table(rows)
+    # Build table rows in one pass and hand Streamlit a ready-made frame
+    records = [
+        (t.title, t.time_str(), t.priority, getattr(t.status, "value", str(t.status)))
+        for t in sorted_tasks
+    ]
+    st.table(pd.DataFrame.from_records(records, columns=["title", "time", "priority", "status"]))
 
-    # Detect conflicts (interval overlaps) and show warnings
+    # Detect conflicts (interval overlaps) and show warnings; only the first
+    # MAX_CONFLICTS_SHOWN (+1 to know whether there are more) are computed
     try:
-        conflicts = st.session_state.system.detect_conflicts(today)
+        conflicts = list(islice(st.session_state.system.iter_conflicts(today), MAX_CONFLICTS_SHOWN + 1))
     except Exception:
         conflicts = []
 
     if conflicts:
         msgs = []
-        for a, b in conflicts:
-            atime = a.due_datetime.strftime('%Y-%m-%d %H:%M') if a.due_datetime is not None else 'unknown'
-            btime = b.due_datetime.strftime('%Y-%m-%d %H:%M') if b.due_datetime is not None else 'unknown'
+        for a, b in conflicts[:MAX_CONFLICTS_SHOWN]:
+            atime = format_datetime(a.due_datetime) if a.due_datetime is not None else 'unknown'
+            btime = format_datetime(b.due_datetime) if b.due_datetime is not None else 'unknown'
             msgs.append(f"{a.title} ({atime}) conflicts with {b.title} ({btime})")
+        if len(conflicts) > MAX_CONFLICTS_SHOWN:
+            msgs.append("...and more")
         st.warning("Conflicts detected:\n" + "\n".join(msgs))
@@ -44,7 +44,7 @@ def main():
     print(f"\nToday's Schedule ({today}):")
     for task in tasks_today:
         print(f"- [{task.status}] {task.title} "
-              f"at {task.due_datetime.strftime('%H:%M')} "
+              f"at {task.time_str()} "
               f"priority={task.priority}"
               )
 
@@ -1,11 +1,131 @@
 from __future__ import annotations
 
 from asyncio import tasks
-from dataclasses import dataclass, field
-from datetime import datetime, date, timedelta
+from bisect import bisect_left, insort
+import calendar
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from datetime import datetime, date, timedelta, timezone
 from enum import Enum
+from functools import partial
+from heapq import heappop, heappush
+from operator import attrgetter, itemgetter
+from itertools import combinations, count, groupby
 import uuid
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+
+# Number of (version, date) views PawPalSystem keeps around.
+_DATE_CACHE_SIZE = 32
+
+# Source of PawPalSystem versions. Each system restamps itself only when its
+# own graph changes; next() on a shared count is atomic under the GIL and
+# never hands out a stamp twice, so concurrent edits cannot land a system back
+# on a version some cached view was built for.
+_stamps = count()
+
+
+# Recurrence frequency codes cached on Task for integer-only due checks.
+_FREQ_NONE = 0
+_FREQ_DAILY = 1
+_FREQ_WEEKLY = 2
+_FREQ_UNKNOWN = 3
+
+
+# Default ids are "<per-process random prefix>-<counter>". The prefix is a
+# whole uuid4 (122 random bits), so ids from different processes collide no
+# more often than UUIDs do, but each id costs a counter step instead of an
+# os.urandom call and hex formatting.
+_ID_PREFIX = uuid.uuid4().hex
+_id_counter = count()
+
+
+def _new_id() -> str:
+    """Return a fresh id for a Task, Pet or Owner."""
+    return f"{_ID_PREFIX}-{next(_id_counter)}"
+
+
+# C-level sort key; avoids a Python frame per element that a lambda costs
+_BY_TIME = attrgetter("due_datetime")
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _to_us(dt: datetime) -> int:
+    """Return dt as integer microseconds since the Unix epoch.
+
+    Naive datetimes are measured from a naive epoch and aware ones from UTC,
+    so the result orders exactly like the datetimes themselves.
+    """
+    return (dt - (_EPOCH if dt.utcoffset() is None else _EPOCH_UTC)) // _ONE_US
+
+
+def _due_never(target_ord: int) -> bool:
+    """Unknown recurrence type; be conservative."""
+    return False
+
+
+def _due_once(base_ord: int, target_ord: int) -> bool:
+    """No recurrence: due date must match exactly."""
+    return target_ord == base_ord
+
+
+def _due_daily(base_ord: int, interval: int, target_ord: int) -> bool:
+    """Due every `interval` days from base_ord on."""
+    delta_days = target_ord - base_ord
+    return delta_days >= 0 and (delta_days % interval) == 0
+
+
+def _due_weekly(base_ord: int, interval: int, target_ord: int) -> bool:
+    """Due in every `interval`-th week from base_ord on."""
+    delta_days = target_ord - base_ord
+    return delta_days >= 0 and ((delta_days // 7) % interval) == 0
+
+
+def _make_is_due(base_ord: int, code: int, interval: int):
+    """Return an is-due-on-ordinal check specialized for one task's recurrence.
+
+    Binding base_ord/interval once means the per-date check is just the
+    arithmetic for that frequency, with no branching on it. The checks are
+    partials over module-level functions, so tasks holding one still pickle.
+    """
+    if code == _FREQ_NONE:
+        return partial(_due_once, base_ord)
+    if code == _FREQ_DAILY:
+        return partial(_due_daily, base_ord, interval)
+    if code == _FREQ_WEEKLY:
+        return partial(_due_weekly, base_ord, interval)
+    return _due_never
+
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    """Return dt shifted by whole months, clamping the day (Jan 31 -> Feb 28/29)."""
+    year, month0 = divmod(dt.year * 12 + (dt.month - 1) + months, 12)
+    month = month0 + 1
+    return dt.replace(year=year, month=month, day=min(dt.day, calendar.monthrange(year, month)[1]))
+
+
+class _DueKey(NamedTuple):
+    """What Task derives from its due_datetime and recurrence for due checks."""
+    due_datetime: datetime  # the values it was derived from
+    recurrence: Optional[Recurrence]
+    base_ord: int
+    code: int  # one of the _FREQ_* codes
+    interval: int
+    is_due: Callable[[int], bool]  # target ordinal -> due that day?
+    due_us: int
+
+
+def _rebuild(obj):
+    """__reduce__ for Task, Pet and Owner: recreate the object from its init fields.
+
+    Back-references, lookup indexes and derived caches are left out, so a
+    pickled or deep-copied task does not drag its pet, owner and system
+    along, and the copy rebuilds its indexes on first use.
+    """
+    return type(obj), tuple(getattr(obj, f.name) for f in fields(obj) if f.init)
 
 
 class TaskStatus(Enum):
@@ -14,30 +134,82 @@ class TaskStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+# Module-level aliases: a global load instead of an Enum class attribute lookup
+# on hot paths such as mark_done.
+_PENDING = TaskStatus.PENDING
+_DONE = TaskStatus.DONE
+
+
+@dataclass(frozen=True, slots=True)
 class Recurrence:
     """A minimal, structured recurrence placeholder.
 
-    For a production system prefer using dateutil.rrule or a richer model.
+    Frozen, so equal rules hash alike and one instance can be shared by many
+    tasks. For a production system prefer using dateutil.rrule or a richer model.
     """
     freq: str  # e.g. 'daily', 'weekly', 'monthly'
     interval: int = 1
     count: Optional[int] = None
     until: Optional[date] = None
 
+    def _advance(self, dt: datetime, periods: int) -> Optional[datetime]:
+        """Return dt moved forward by `periods` whole recurrence periods."""
+        n = periods * self.interval
+        if self.freq == "daily":
+            return dt + timedelta(days=n)
+        if self.freq == "weekly":
+            return dt + timedelta(weeks=n)
+        if self.freq == "monthly":
+            return _add_months(dt, n)
+        if self.freq == "yearly":
+            return _add_months(dt, 12 * n)
+        return None
+
+    def next_after(self, dt: datetime) -> Optional[datetime]:
+        """Return the occurrence one period after dt, or None for an unknown freq."""
+        return self._advance(dt, 1)
+
+    def catch_up(self, dt: datetime, now: datetime) -> Optional[datetime]:
+        """Return the first occurrence of the series starting at dt that is after now.
+
+        The number of missed periods is computed directly rather than by
+        stepping through them, so a long gap costs the same as a short one.
+        """
+        if dt > now:
+            return dt
+        if self.freq in ("daily", "weekly"):
+            period = self._advance(dt, 1) - dt
+            return dt + ((now - dt) // period + 1) * period
+        if self.freq in ("monthly", "yearly"):
+            months = self.interval * (1 if self.freq == "monthly" else 12)
+            elapsed = (now.year - dt.year) * 12 + (now.month - dt.month)
+            candidate = _add_months(dt, (elapsed // months) * months)
+            if candidate <= now:
+                candidate = _add_months(dt, (elapsed // months + 1) * months)
+            return candidate
+        return None
+
 
-@dataclass
-class Task:
+class _TaskState:
+    """Task's derived caches, kept off its dataclass fields like _PetState."""
+
+    # _due_key: rebuilt whenever due_datetime or recurrence is reassigned
+    # _time_str: (due_datetime, "HH:MM") so UIs re-rendering the schedule skip re-formatting
+    __slots__ = ("_due_key", "_time_str")
+
+
+@dataclass(slots=True)
+class Task(_TaskState):
     """Task represents a schedulable item.
 
     Notes:
     - Prefer timezone-aware datetimes. This skeleton accepts datetimes and
       callers should normalize to UTC before storing.
     - Both a start time and/or a due time are supported. Duration is optional.
-    - task_id defaults to a UUID string to avoid collisions on human names.
+    - task_id defaults to a generated unique id to avoid collisions on human names.
     """
 
-    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    task_id: str = field(default_factory=_new_id)
     title: str = ""
     # Prefer start_datetime for interval tasks. due_datetime can be used for
     # deadline-style tasks.
@@ -45,96 +217,220 @@ class Task:
     due_datetime: Optional[datetime] = None
     duration: Optional[timedelta] = None
     priority: int = 3
-    status: TaskStatus = TaskStatus.PENDING
+    status: TaskStatus = _PENDING
     recurrence: Optional[Recurrence] = None
     # optional link to parent pet id (system may populate this)
     pet_id: Optional[str] = None
 
+    __reduce__ = _rebuild
+
+    def __post_init__(self) -> None:
+        """Start with empty caches; they are filled on first use."""
+        self._due_key = None
+        self._time_str = None
+
     def mark_done(self) -> None:
         """Mark this task as completed."""
-        self.status = TaskStatus.DONE
-
-    def is_due_on(self, target_date: date) -> bool:
-        """Return True if this task (or an occurrence) falls on target_date."""
+        self.status = _DONE
+
+    def time_str(self) -> str:
+        """Return the due time as 'HH:MM', or '--:--' if there is no due_datetime."""
+        dt = self.due_datetime
+        if dt is None:
+            return "--:--"
+        cached = self._time_str
+        if cached is None or cached[0] is not dt:
+            cached = self._time_str = (dt, f"{dt.hour:02d}:{dt.minute:02d}")
+        return cached[1]
+
+    def _recurrence_key(self) -> _DueKey:
+        """Return the cached _due_key, rebuilding it if due_datetime/recurrence changed."""
+        key = self._due_key
+        if key is not None and key.due_datetime is self.due_datetime and key.recurrence is self.recurrence:
+            return key
+
+        rec = self.recurrence
+        if not rec:
+            code, interval = _FREQ_NONE, 1
+        elif isinstance(rec, Recurrence) and rec.freq == "daily":
+            code, interval = _FREQ_DAILY, rec.interval
+        elif isinstance(rec, Recurrence) and rec.freq == "weekly":
+            code, interval = _FREQ_WEEKLY, rec.interval
+        else:
+            code, interval = _FREQ_UNKNOWN, 1
+
+        base_ord = self.due_datetime.toordinal()
+        self._due_key = _DueKey(self.due_datetime, rec, base_ord, code, interval, _make_is_due(base_ord, code, interval),
+                                _to_us(self.due_datetime))
+        return self._due_key
+
+    @property
+    def due_us(self) -> Optional[int]:
+        """due_datetime as integer epoch microseconds (cached), or None if unset."""
         if self.due_datetime is None:
-            return False
-
-        base_date = self.due_datetime.date()
-        # No recurrence: due date must match exactly
-        if not self.recurrence:
-            return base_date == target_date
+            return None
+        return self._recurrence_key().due_us
 
-        # Simple recurrence: support 'daily' and 'weekly' with interval in Recurrence
-        delta_days = (target_date - base_date).days
-        if delta_days < 0:
+    def _is_due_on_ordinal(self, target_ord: int) -> bool:
+        """Same as is_due_on, but for a proleptic Gregorian ordinal (date.toordinal())."""
+        if self.due_datetime is None:
             return False
+        return self._recurrence_key().is_due(target_ord)
 
-        freq = self.recurrence.freq if isinstance(self.recurrence, Recurrence) else None
-        interval = self.recurrence.interval if isinstance(self.recurrence, Recurrence) else 1
-
-        if freq == "daily":
-            return (delta_days % interval) == 0
-        if freq == "weekly":
-            return ((delta_days // 7) % interval) == 0
-
-        # Unknown recurrence type; be conservative
-        return False
+    def is_due_on(self, target_date: date) -> bool:
+        """Return True if this task (or an occurrence) falls on target_date."""
+        return self._is_due_on_ordinal(target_date.toordinal())
 
     def next_occurrence(self) -> Optional[datetime]:
         """Return the next occurrence datetime for recurring tasks, if any."""
         if self.due_datetime is None or not self.recurrence:
             return None
 
-        now = datetime.now(self.due_datetime.tzinfo)
         base = self.due_datetime
+        key = self._recurrence_key()
+        if key.code == _FREQ_DAILY:
+            period = key.interval
+        elif key.code == _FREQ_WEEKLY:
+            period = 7 * key.interval
+        else:
+            return None
 
-        freq = self.recurrence.freq
-        interval = self.recurrence.interval
-
-        if freq == "daily":
-            days = (now.date() - base.date()).days
-            if days < 0:
-                return base
-            # how many intervals have passed
-            steps = (days // interval) + 1
-            return datetime.combine(base.date() + timedelta(days=steps * interval), base.time())
-
-        if freq == "weekly":
-            days = (now.date() - base.date()).days
-            if days < 0:
-                return base
-            weeks = (days // 7)
-            steps = (weeks // interval) + 1
-            return datetime.combine(base.date() + timedelta(weeks=steps * interval), base.time())
+        base_ord = key.base_ord
+        days = datetime.now(base.tzinfo).toordinal() - base_ord
+        if days < 0:
+            return base
+        # jump straight past today: (intervals elapsed + 1) whole periods
+        target = date.fromordinal(base_ord + (days // period + 1) * period)
+        return base.replace(year=target.year, month=target.month, day=target.day)
 
-        return None
+
+class _PetState:
+    """Pet's private state, kept off its dataclass fields.
+
+    Slots declared on a base class are not fields, so asdict/astuple and the
+    generated __eq__/__repr__ only see the public data and never follow the
+    back-reference up to the owner.
+    """
+
+    # _parent: the Owner this pet was last added to
+    # _tasks_by_id: task_id -> task, mirrors `tasks` (first task wins on duplicate ids)
+    # _by_title_time: (title, due_datetime) -> task, so recurrence can check for
+    #   an existing occurrence
+    # _indexed: False once `tasks` or a task's task_id/title/due_datetime
+    #   changed since the two indexes were built
+    __slots__ = ("_parent", "_tasks_by_id", "_by_title_time", "_indexed")
 
 
-@dataclass
-class Pet:
+@dataclass(slots=True)
+class Pet(_PetState):
     name: str
     species: str
     age: int
     notes: str = ""
     tasks: List[Task] = field(default_factory=list)
-    pet_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    pet_id: str = field(default_factory=_new_id)
+
+    __reduce__ = _rebuild
+
+    def __post_init__(self) -> None:
+        """Index any tasks passed to the constructor."""
+        self._parent = None
+        self._indexed = False
+        self._task_index()
+
+    def _touch(self, change: Optional[str] = None, task: Optional[Task] = None) -> None:
+        """Tell the owner (and through it the system) that this pet's schedule changed.
+
+        change is "add", "move" or "drop" when only `task` was added,
+        rescheduled or removed, so the system can update its catalog in place.
+        """
+        owner = self._parent
+        if owner is not None:
+            owner._touch(self, change, task)
+
+    def tasks_changed(self) -> None:
+        """Resync after editing `tasks` or a task's fields directly.
+
+        add_task/remove_task/reschedule_task keep the lookups and any system's
+        cached days in step on their own; direct list and field edits are not
+        tracked.
+        """
+        self._indexed = False
+        self._touch()
+
+    def _task_index(self) -> Dict[str, Task]:
+        """Return the task_id index, rebuilding both indexes if `tasks` or a task changed since."""
+        if not self._indexed:
+            by_id: Dict[str, Task] = {}
+            by_title_time: Dict[Tuple[str, Optional[datetime]], Task] = {}
+            for t in self.tasks:
+                by_id.setdefault(t.task_id, t)
+                by_title_time.setdefault((t.title, t.due_datetime), t)
+            self._tasks_by_id = by_id
+            self._by_title_time = by_title_time
+            self._indexed = True
+        return self._tasks_by_id
 
     def add_task(self, task: Task) -> None:
         """Attach a task to this pet (in-memory only)."""
         # attach lightweight back-reference and store
         task.pet_id = getattr(self, "pet_id", None)
+        by_id = self._task_index()
         self.tasks.append(task)
+        by_id.setdefault(task.task_id, task)
+        self._by_title_time.setdefault((task.title, task.due_datetime), task)
+        self._touch("add", task)
+
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Return a task by its id, or None if not found."""
+        return self._task_index().get(task_id)
+
+    def find_task(self, title: str, due_datetime: Optional[datetime]) -> Optional[Task]:
+        """Return a task with this title and due_datetime, or None if not found."""
+        self._task_index()
+        return self._by_title_time.get((title, due_datetime))
 
     def remove_task(self, task_id: str) -> bool:
         """Remove a task by its id; return True if removed."""
+        task = self._task_index().get(task_id)
+        if task is None:
+            return False
+        # the indexes are rebuilt on next use, so a later task sharing this
+        # id or (title, due_datetime) takes over the slot
         for i, t in enumerate(self.tasks):
-            if t.task_id == task_id:
+            if t is task:
                 del self.tasks[i]
-                return True
-        return False
+                break
+        self._indexed = False
+        self._touch("drop", task)
+        return True
+
+    def reschedule_task(self, task_id: str, /, **changes) -> Task:
+        """Update fields of one of this pet's tasks, e.g. due_datetime, title or task_id.
+
+        Assigning a task's fields directly is not tracked: this pet's lookups
+        and any system's cached days would keep the old values until
+        tasks_changed() is called. Going through here keeps them in step.
+        """
+        task = self._task_index().get(task_id)
+        if task is None:
+            raise ValueError(f"Task '{task_id}' not found for pet '{self.name}'")
+        for name, value in changes.items():
+            setattr(task, name, value)
+        self._indexed = False
+        self._touch("move", task)
+        return task
 
     def get_tasks_for_date(self, target_date: date) -> List[Task]:
         """Return tasks (including recurring occurrences) that fall on target_date."""
+        # Fast path: one comprehension with no per-task try/except setup.
+        target_ord = target_date.toordinal()
+        try:
+            return [t for t in self.tasks if t._is_due_on_ordinal(target_ord)]
+        except Exception:
+            pass
+
+        # Something raised; redo the scan task by task, skipping the bad ones
         results: List[Task] = []
         for t in self.tasks:
             try:
@@ -146,33 +442,92 @@ class Pet:
         return results
 
 
-@dataclass
-class Owner:
+class _OwnerState:
+    """Owner's private state, kept off its dataclass fields like _PetState."""
+
+    # _parent: the PawPalSystem this owner was registered with
+    # _pets_by_name / _pets_by_id: name -> pet and pet_id -> pet, both mirroring `pets`
+    # _indexed: False once `pets` or a pet's name/pet_id changed since the two
+    #   indexes were built
+    __slots__ = ("_parent", "_pets_by_name", "_pets_by_id", "_indexed")
+
+
+@dataclass(slots=True)
+class Owner(_OwnerState):
     name: str
     pets: List[Pet] = field(default_factory=list)
-    owner_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    owner_id: str = field(default_factory=_new_id)
+
+    __reduce__ = _rebuild
+
+    def __post_init__(self) -> None:
+        """Index any pets passed to the constructor."""
+        self._parent = None
+        self._indexed = False
+        self._pet_index()
+
+    def _touch(self, pet: Optional[Pet] = None, change: Optional[str] = None,
+               task: Optional[Task] = None) -> None:
+        """Tell the system that this owner's schedule changed; see Pet._touch."""
+        system = self._parent
+        if system is not None:
+            system._touch(self, pet, change, task)
+
+    def pets_changed(self) -> None:
+        """Resync after editing `pets` or a pet's name/pet_id directly; like Pet.tasks_changed."""
+        self._indexed = False
+        self._touch()
+
+    def _pet_index(self) -> Dict[str, Pet]:
+        """Return the name index, rebuilding both indexes if `pets` changed since."""
+        if not self._indexed:
+            by_name: Dict[str, Pet] = {}
+            by_id: Dict[str, Pet] = {}
+            for p in self.pets:
+                p._parent = self
+                by_name.setdefault(p.name, p)
+                by_id.setdefault(p.pet_id, p)
+            self._pets_by_name = by_name
+            self._pets_by_id = by_id
+            self._indexed = True
+        return self._pets_by_name
 
     def add_pet(self, pet: Pet) -> None:
         """Add a pet to this owner, rejecting duplicate names."""
         # disallow duplicate pet names for simplicity
-        if any(p.name == pet.name for p in self.pets):
+        by_name = self._pet_index()
+        if pet.name in by_name:
             raise ValueError(f"Pet with name '{pet.name}' already exists for owner '{self.name}'")
+        pet._parent = self
         self.pets.append(pet)
+        by_name[pet.name] = pet
+        self._pets_by_id.setdefault(pet.pet_id, pet)
+        self._touch()
 
     def remove_pet(self, pet_name: str) -> bool:
         """Remove a pet by name; return True if removed."""
+        pet = self._pet_index().get(pet_name)
+        if pet is None:
+            return False
+        # the indexes are rebuilt on next use
         for i, p in enumerate(self.pets):
-            if p.name == pet_name:
+            if p is pet:
                 del self.pets[i]
-                return True
-        return False
+                break
+        self._indexed = False
+        self._touch()
+        if pet._parent is self:
+            pet._parent = None
+        return True
 
     def get_pet(self, pet_name: str) -> Optional[Pet]:
         """Return a pet by name, or None if not found."""
-        for p in self.pets:
-            if p.name == pet_name:
-                return p
-        return None
+        return self._pet_index().get(pet_name)
+
+    def get_pet_by_id(self, pet_id: str) -> Optional[Pet]:
+        """Return a pet by its pet_id, or None if not found."""
+        self._pet_index()
+        return self._pets_by_id.get(pet_id)
 
     def get_all_tasks(self) -> List[Task]:
         """Return all tasks belonging to this owner's pets."""
@@ -182,6 +537,116 @@ class Owner:
         return results
 
 
+class DayView(NamedTuple):
+    """One day's schedule: tasks in due-time order and the overlapping pairs."""
+    tasks: List[Task]
+    conflicts: List[Tuple[Task, Task]]
+
+
+def _lru_put(cache: OrderedDict, key, value) -> None:
+    """Insert into an OrderedDict LRU, evicting the oldest past _DATE_CACHE_SIZE."""
+    cache[key] = value
+    if len(cache) > _DATE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+class _TaskCatalog:
+    """Every task under a PawPalSystem, laid out for per-day queries.
+
+    One-off tasks are (ordinal, rank, owner, pet, task) sorted by due
+    ordinal, so a day's tasks are one bisected slice; recurring tasks are
+    (rank, owner, pet, task) in rank order and are checked one by one. A rank
+    is (owner no., pet no., task no.) and follows the owner -> pet -> task
+    walk, so tasks sharing a due time keep that order. Tasks with no
+    due_datetime, an unknown recurrence or one that cannot be read are never
+    due and are left out.
+
+    add/move/drop update it in place and raise LookupError when the task is
+    not where the catalog expects it, e.g. after a direct edit; the system
+    then rebuilds it.
+    """
+
+    __slots__ = ("one_off", "recurring", "_pet_ranks", "_placed", "_last_no")
+
+    def __init__(self, owners: Iterable[Owner]) -> None:
+        self.one_off: List[tuple] = []
+        self.recurring: List[tuple] = []
+        # id(pet) -> (owner no., pet no.)
+        self._pet_ranks: Dict[int, Tuple[int, int]] = {}
+        # id(task) -> (rank, its one_off/recurring entry or None); None for a
+        # task listed more than once, which only a rebuild can handle
+        self._placed: Dict[int, Optional[tuple]] = {}
+        no = 0
+        for i, owner in enumerate(owners):
+            for j, pet in enumerate(owner.pets):
+                self._pet_ranks[id(pet)] = (i, j)
+                for t in pet.tasks:
+                    no += 1
+                    listed_twice = id(t) in self._placed
+                    self._file(owner, pet, t, (i, j, no), sort=False)
+                    if listed_twice:
+                        self._placed[id(t)] = None
+        self.one_off.sort(key=itemgetter(0, 1))
+        self._last_no = no
+
+    def _file(self, owner: Owner, pet: Pet, task: Task, rank: tuple, sort: bool = True) -> None:
+        """Enter task under rank (kept sorted unless sort is False) and record where."""
+        entry = None
+        if task.due_datetime is not None:
+            try:
+                key = task._recurrence_key()
+            except Exception:
+                # be forgiving for placeholder implementations
+                key = None
+            if key is None or key.code == _FREQ_UNKNOWN:
+                pass
+            elif key.code == _FREQ_NONE:
+                entry = (key.base_ord, rank, owner, pet, task)
+                if sort:
+                    insort(self.one_off, entry)
+                else:
+                    self.one_off.append(entry)
+            else:
+                entry = (rank, owner, pet, task)
+                if sort:
+                    insort(self.recurring, entry)
+                else:
+                    self.recurring.append(entry)
+        self._placed[id(task)] = (rank, entry)
+
+    def _unfile(self, task: Task) -> tuple:
+        """Take task out of the catalog and return its rank."""
+        placed = self._placed.pop(id(task))
+        if placed is None:
+            raise LookupError(task.task_id)
+        rank, entry = placed
+        if entry is not None:
+            # ranks are unique, so (ordinal, rank) or (rank,) pins the entry down
+            if len(entry) == 5:
+                entries, i = self.one_off, bisect_left(self.one_off, entry[:2])
+            else:
+                entries, i = self.recurring, bisect_left(self.recurring, entry[:1])
+            if i == len(entries) or entries[i] is not entry:
+                raise LookupError(task.task_id)
+            del entries[i]
+        return rank
+
+    def add(self, owner: Owner, pet: Pet, task: Task) -> None:
+        """Enter a task just appended to pet.tasks, after the pet's other tasks."""
+        if id(task) in self._placed:
+            raise LookupError(task.task_id)
+        self._last_no += 1
+        self._file(owner, pet, task, self._pet_ranks[id(pet)] + (self._last_no,))
+
+    def move(self, owner: Owner, pet: Pet, task: Task) -> None:
+        """Re-file a task whose due_datetime/recurrence changed, keeping its rank."""
+        self._file(owner, pet, task, self._unfile(task))
+
+    def drop(self, owner: Owner, pet: Pet, task: Task) -> None:
+        """Forget a task just removed from pet.tasks."""
+        self._unfile(task)
+
+
 class PawPalSystem:
     """Top-level system managing owners, pets and tasks.
 
@@ -194,7 +659,11 @@ class PawPalSystem:
 
     def sort_by_time(self, tasks):
         """Return tasks sorted by due time."""
-        return sorted(tasks, key=lambda t: t.due_datetime)
+        return sorted(tasks, key=_BY_TIME)
+
+    def sort_by_time_inplace(self, tasks):
+        """Sort a list of tasks by due time in place."""
+        tasks.sort(key=_BY_TIME)
 
     def filter_by_status(self, tasks, status):
         """Return tasks filtered by completion status."""
@@ -202,30 +671,96 @@ class PawPalSystem:
 
     def __init__(self, owners: Optional[Dict[str, Owner]] = None) -> None:
         """Create a new PawPalSystem with an optional initial owners mapping."""
+        # stamp from _stamps, renewed by _touch() whenever an owner, pet or
+        # task reachable from this system changes; keys every cache below
+        self._version = next(_stamps)
+        # owner.name -> owner_id so name-based callers (CLI, UI) stay O(1)
+        self._owners_by_name: Dict[str, str] = {}
+        # False once `owners` changed since _owners_by_name was built
+        self._owners_indexed = True
         # owners keyed by owner_id (not owner.name) to avoid collisions
-        self.owners: Dict[str, Owner] = owners if owners is not None else {}
+        self.owners: Dict[str, Owner] = {}
+        # (version, date) -> [(owner, pet, task)], most recently used last
+        self._date_cache: OrderedDict[Tuple[int, date], List[Tuple[Owner, Pet, Task]]] = OrderedDict()
+        # (version, date) -> detect_conflicts result, same LRU policy
+        self._conflict_cache: OrderedDict[Tuple[int, date], List[Tuple[Task, Task]]] = OrderedDict()
+        # kept in step by add_task/remove_task/reschedule_task; None until
+        # first needed and after any other change; see _task_catalog
+        self._catalog: Optional[_TaskCatalog] = None
+        # the initial mapping may be keyed either way; re-key it by owner_id
+        for owner in (owners or {}).values():
+            self.add_owner(owner)
+
+    def __reduce__(self):
+        # rebuild through __init__, like Task/Pet/Owner, leaving caches behind
+        return PawPalSystem, (dict(self.owners),)
+
+    def _touch(self, owner: Optional[Owner] = None, pet: Optional[Pet] = None,
+               change: Optional[str] = None, task: Optional[Task] = None) -> None:
+        """Record that the owner/pet/task graph under this system was mutated.
+
+        A single task added, rescheduled or removed (see Pet._touch) is applied
+        to the catalog in place; any other change drops it for a rebuild.
+        """
+        self._version = next(_stamps)
+        catalog = self._catalog
+        if catalog is None:
+            return
+        try:
+            if change == "add":
+                catalog.add(owner, pet, task)
+            elif change == "move":
+                catalog.move(owner, pet, task)
+            elif change == "drop":
+                catalog.drop(owner, pet, task)
+            else:
+                self._catalog = None
+        except LookupError:
+            self._catalog = None
+
+    def owners_changed(self) -> None:
+        """Resync after editing `owners` or an owner's name directly; like Pet.tasks_changed."""
+        self._owners_indexed = False
+        self._touch()
+
+    def _owner_index(self) -> Dict[str, str]:
+        """Return the owner name -> owner_id index, rebuilding it if `owners` changed since."""
+        if not self._owners_indexed:
+            by_name: Dict[str, str] = {}
+            for owner_id, owner in self.owners.items():
+                owner._parent = self
+                by_name.setdefault(owner.name, owner_id)
+            self._owners_by_name = by_name
+            self._owners_indexed = True
+        return self._owners_by_name
 
     def add_owner(self, owner: Owner) -> None:
-        """Register a new owner in the system, rejecting duplicate names."""
-        if owner.name in self.owners:
+        """Register a new owner in the system, rejecting duplicate names or ids."""
+        by_name = self._owner_index()
+        if owner.name in by_name:
             raise ValueError(f"Owner with name '{owner.name}' already exists")
-        self.owners[owner.name] = owner
+        if owner.owner_id in self.owners:
+            raise ValueError(f"Owner with id '{owner.owner_id}' already exists")
+        owner._parent = self
+        self.owners[owner.owner_id] = owner
+        by_name[owner.name] = owner.owner_id
+        self._touch()
+
+    def get_owner(self, owner_key: str) -> Optional[Owner]:
+        """Return an owner by name or owner_id, or None if not found."""
+        return self.owners.get(self._owner_index().get(owner_key, owner_key))
 
     def schedule_task(self, owner_id: str, pet_id: str, task: Task) -> None:
         """Schedule a task for the named owner and pet, validating existence."""
         # This method signature is kept backward-compatible with owner_id/pet_id
         # but we also support name-based scheduling via owner name and pet name.
         # Attempt to resolve owner by name first (common CLI case).
-        owner = self.owners.get(owner_id)
+        owner = self.get_owner(owner_id)
         if owner is None:
             raise ValueError(f"Owner '{owner_id}' not found")
 
         # find pet by id or name
-        pet = None
-        for p in owner.pets:
-            if getattr(p, "pet_id", None) == pet_id or p.name == pet_id:
-                pet = p
-                break
+        pet = owner.get_pet_by_id(pet_id) or owner.get_pet(pet_id)
 
         if pet is None:
             raise ValueError(f"Pet '{pet_id}' not found for owner '{owner.name}'")
@@ -236,7 +771,7 @@ class PawPalSystem:
 
     def mark_task_complete(self, owner_name: str, pet_name: str, task_id: str) -> None:
         """Mark a task done and, if recurring daily/weekly, schedule the next occurrence."""
-        owner = self.owners.get(owner_name)
+        owner = self.get_owner(owner_name)
         if owner is None:
             raise ValueError(f"Owner '{owner_name}' not found")
 
@@ -244,110 +779,203 @@ class PawPalSystem:
         if pet is None:
             raise ValueError(f"Pet '{pet_name}' not found for owner '{owner_name}'")
 
-        # find the task
-        task = None
-        for t in pet.tasks:
-            if t.task_id == task_id:
-                task = t
-                break
-
+        task = pet.get_task(task_id)
         if task is None:
             raise ValueError(f"Task '{task_id}' not found for pet '{pet_name}'")
 
-        # mark original done
+        # mark original done; status is not part of any cached view
         task.mark_done()
+        self._maybe_spawn_recurrence(pet, task)
 
-        # if recurring daily or weekly, create next occurrence
-        if isinstance(task.recurrence, Recurrence) and task.due_datetime is not None:
-            freq = task.recurrence.freq
-            if freq == "daily":
-                delta = timedelta(days=1)
-            elif freq == "weekly":
-                delta = timedelta(weeks=1)
-            else:
-                return
-
-            new_due = task.due_datetime + delta
-            new_task = Task(
-                title=task.title,
-                due_datetime=new_due,
-                priority=task.priority,
-                duration=task.duration,
-                recurrence=task.recurrence,
-            )
-            new_task.pet_id = task.pet_id
-            pet.add_task(new_task)
+    def _maybe_spawn_recurrence(self, pet: Pet, task: Task) -> Optional[Task]:
+        """If task recurs daily/weekly, return its next occurrence on pet.
+
+        The occurrence is only created if pet does not already have a task
+        with the same title at that time, so completing twice is harmless.
+        """
+        if not isinstance(task.recurrence, Recurrence) or task.due_datetime is None:
+            return None
+
+        # only spawn for the frequencies is_due_on understands
+        if task.recurrence.freq not in ("daily", "weekly"):
+            return None
+
+        new_due = task.recurrence.next_after(task.due_datetime)
+        existing = pet.find_task(task.title, new_due)
+        if existing is not None:
+            return existing
+
+        new_task = Task(
+            title=task.title,
+            due_datetime=new_due,
+            priority=task.priority,
+            duration=task.duration,
+            recurrence=task.recurrence,
+        )
+        # add_task sets pet_id and registers the new id in the pet's index,
+        # so the next mark_task_complete on it is a dict probe as well
+        pet.add_task(new_task)
+        return new_task
+
+    def _task_catalog(self) -> _TaskCatalog:
+        """Return the catalog of every task under this system, rebuilding it if dropped.
+
+        The rebuild also points every owner and pet back at its container, so
+        add_task/remove_task/reschedule_task calls made after it reach this
+        system's _touch() and keep the catalog up to date.
+        """
+        catalog = self._catalog
+        if catalog is None:
+            for owner in self.owners.values():
+                owner._parent = self
+                for pet in owner.pets:
+                    pet._parent = owner
+            catalog = self._catalog = _TaskCatalog(self.owners.values())
+        return catalog
+
+    def _entries_for_date(self, target_date: date) -> List[Tuple[Owner, Pet, Task]]:
+        """Return cached (owner, pet, task) triples due on target_date, by due time.
+
+        Entries are sorted once when built (stably, so tasks sharing a time
+        keep owner/pet/insertion order) and keyed by the system version, so
+        any mutation made through add_task/add_pet/add_owner/... invalidates
+        them implicitly.
+        """
+        key = (self._version, target_date)
+        entries = self._date_cache.get(key)
+        if entries is not None:
+            self._date_cache.move_to_end(key)
+            return entries
+
+        target_ord = target_date.toordinal()
+        try:
+            catalog = self._task_catalog()
+            one_off = catalog.one_off
+            # one-off tasks due that day are a contiguous slice: two bisects
+            lo = bisect_left(one_off, (target_ord,))
+            hi = bisect_left(one_off, (target_ord + 1,), lo)
+            found = [e[1:] for e in one_off[lo:hi]]
+            found += [e for e in catalog.recurring if e[3]._is_due_on_ordinal(target_ord)]
+            # rank breaks ties, so equal times keep owner/pet/task order
+            found.sort(key=lambda e: (e[3].due_us, e[0]))
+            entries = [e[1:] for e in found]
+        except Exception:
+            # fall back to the per-pet scan, which skips tasks that raise
+            entries = [(owner, pet, t)
+                       for owner in self.owners.values()
+                       for pet in owner.pets
+                       for t in pet.get_tasks_for_date(target_date)]
+            entries.sort(key=lambda e: e[2].due_us)
+
+        _lru_put(self._date_cache, key, entries)
+        return entries
 
     def get_todays_tasks(self, target_date: date) -> List[Task]:
-        """Return all tasks due on target_date across all owners and pets."""
-        # Return tasks due on target_date across all owners and pets
-        results: List[Task] = []
-        for owner in self.owners.values():
-            for pet in owner.pets:
-                results.extend(pet.get_tasks_for_date(target_date))
-        return results
+        """Return all tasks due on target_date across all owners and pets.
+
+        Tasks come back in due-time order, so sort_by_time/sort_tasks on the
+        result is a linear pass.
+        """
+        # fresh list each call so callers may sort/mutate it freely
+        return [t for _, _, t in self._entries_for_date(target_date)]
+
+    def iter_conflicts(self, target_date: date) -> Iterator[Tuple[Task, Task]]:
+        """Yield pairs of tasks that overlap on target_date, as (earlier, later) start.
+
+        Pairs come out ordered by the later task's start time, so callers that
+        only show the first few conflicts can stop without computing the rest.
+        """
+        # Build occurrences list with start/end (epoch microseconds) from the
+        # (cached) day view
+        occs: List[Tuple[Task, int, int]] = []
+        for t in self.get_todays_tasks(target_date):
+            if t.due_datetime is None:
+                continue
+            start = t.due_us
+            # a negative duration is treated like none, as a point in time
+            end = start + max(t.duration // _ONE_US, 0) if t.duration else start
+            occs.append((t, start, end))
+
+        if all(start == end for _, start, end in occs):
+            # Only point-in-time tasks: two overlap exactly when they share a
+            # start. The day view is already in start order, so equal starts
+            # are adjacent runs; no hashing, bucketing or re-sorting needed.
+            for _, run in groupby(occs, key=itemgetter(1)):
+                group = [t for t, _, _ in run]
+                if len(group) > 1:
+                    yield from combinations(group, 2)
+            return
+
+        # Plane sweep over occs, which is already in start order: a min-heap
+        # of (end, pos) retires tasks that ended strictly before the current
+        # start; whatever is still open overlaps it. Ends equal to the start
+        # stay open, so tasks sharing a due_datetime conflict. open_tasks is
+        # insertion-ordered by start.
+        open_tasks: Dict[int, Task] = {}
+        ends: List[Tuple[int, int]] = []
+        for pos, (ti, si, ei) in enumerate(occs):
+            while ends and ends[0][0] < si:
+                del open_tasks[heappop(ends)[1]]
+            for o in open_tasks.values():
+                yield o, ti
+            open_tasks[pos] = ti
+            heappush(ends, (ei, pos))
 
     def detect_conflicts(self, target_date: date) -> List[Tuple[Task, Task]]:
         """Detect pairs of tasks that overlap on target_date."""
-        # Build occurrences list with start/end
-        occs: List[Tuple[Task, datetime, datetime]] = []
-        for owner in self.owners.values():
-            for pet in owner.pets:
-                for t in pet.get_tasks_for_date(target_date):
-                    start = t.due_datetime
-                    end = start + t.duration if (t.duration is not None) else start
-                    occs.append((t, start, end))
-
-        # sort by start
-        occs.sort(key=lambda x: x[1])
-
-        conflicts: List[Tuple[Task, Task]] = []
-        # naive O(n^2) for small lists: compare each pair where starts overlap
-        for i in range(len(occs)):
-            ti, si, ei = occs[i]
-            for j in range(i + 1, len(occs)):
-                tj, sj, ej = occs[j]
-                # overlap if the later start is before or equal to the earlier end.
-                # Treat tasks with the same due_datetime as a conflict.
-                if sj <= ei:
-                    conflicts.append((ti, tj))
-                else:
-                    # since sorted by start, no further overlaps for i
-                    break
-
-        return conflicts
+        key = (self._version, target_date)
+        conflicts = self._conflict_cache.get(key)
+        if conflicts is None:
+            conflicts = list(self.iter_conflicts(target_date))
+            _lru_put(self._conflict_cache, key, conflicts)
+        else:
+            self._conflict_cache.move_to_end(key)
+        return list(conflicts)
+
+    def day_view(self, target_date: date) -> DayView:
+        """Return target_date's tasks in time order together with their conflicts.
+
+        Both halves come from the per-(version, date) caches, so a page
+        that shows the schedule and its warnings filters and sorts the day
+        once no matter how many times it asks.
+        """
+        return DayView(self.get_todays_tasks(target_date), self.detect_conflicts(target_date))
 
     def detect_exact_time_conflicts(self, target_date: date) -> List[str]:
         """Return warning strings for tasks that share the exact same due_datetime on target_date."""
-        # Map datetime -> list of (owner, pet, task)
-        groups: Dict[datetime, List[Tuple[Owner, Pet, Task]]] = {}
-        for owner in self.owners.values():
-            for pet in owner.pets:
-                for t in pet.get_tasks_for_date(target_date):
-                    if t.due_datetime is None:
-                        continue
-                    dt = t.due_datetime
-                    groups.setdefault(dt, []).append((owner, pet, t))
+        # The day view is already sorted by due time (stably, so tasks within
+        # a run keep their pet order); report each run of equal datetimes.
+        items = [(t.due_datetime, owner, pet, t)
+                 for owner, pet, t in self._entries_for_date(target_date)
+                 if t.due_datetime is not None]
 
         warnings: List[str] = []
-        for dt, entries in groups.items():
-            if len(entries) > 1:
+        start = 0
+        n = len(items)
+        while start < n:
+            dt = items[start][0]
+            end = start + 1
+            while end < n and items[end][0] == dt:
+                end += 1
+            if end - start > 1:
                 # create a single warning summarizing all tasks at this datetime
                 parts = []
-                for owner, pet, t in entries:
+                for _, owner, pet, t in items[start:end]:
                     parts.append(f"{owner.name}/{pet.name}:{t.title} (id={t.task_id})")
                 warnings.append(f"Conflict at {dt}: " + ", ".join(parts))
+            start = end
 
         return warnings
 
     def sort_tasks(self, tasks: List[Task]) -> List[Task]:
         """Return tasks sorted by due datetime (earlier first), then priority (higher first)."""
-        # Sort by due_datetime (earlier first) then by priority (higher first)
-        def key_fn(t: Task):
-            dd = t.due_datetime if t.due_datetime is not None else datetime.max
-            return (dd, -t.priority)
-
-        return sorted(tasks, key=key_fn)
+        # Sort by due_datetime (earlier first) then by priority (higher first).
+        # Keys are built once per task; the index keeps the sort stable
+        # without ever falling back to comparing Task objects.
+        _max = datetime.max
+        keyed = [(t.due_datetime or _max, -t.priority, i, t) for i, t in enumerate(tasks)]
+        keyed.sort()
+        return [k[-1] for k in keyed]
 
 
 if __name__ == "__main__":
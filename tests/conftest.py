@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from pawpal_system import PawPalSystem, Owner, Pet, Task
+
+
+@pytest.fixture
+def sop():
+    """A fresh (system, owner, pet) triple: owner "Taylor" with one pet, Fido, and no tasks."""
+    system = PawPalSystem()
+    owner = Owner(name="Taylor")
+    pet = Pet(name="Fido", species="Dog", age=4)
+    owner.add_pet(pet)
+    system.add_owner(owner)
+    return system, owner, pet
+
+
+@pytest.fixture(scope="module")
+def seeded_system():
+    """Owner "Taylor" with Fido and Whiskers and a handful of tasks on 2026-02-15.
+
+    Built once per test module and shared, so tests using it must only read.
+    """
+    system = PawPalSystem()
+    owner = Owner(name="Taylor")
+    fido = Pet(name="Fido", species="Dog", age=4)
+    whiskers = Pet(name="Whiskers", species="Cat", age=2)
+    owner.add_pet(fido)
+    owner.add_pet(whiskers)
+    system.add_owner(owner)
+
+    fido.add_task(Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0),
+                       duration=timedelta(minutes=60)))
+    fido.add_task(Task(task_id="meds", title="Medication", due_datetime=datetime(2026, 2, 15, 9, 30)))
+    fido.add_task(Task(task_id="dinner", title="Dinner", due_datetime=datetime(2026, 2, 15, 18, 0)))
+    whiskers.add_task(Task(task_id="play", title="Play", due_datetime=datetime(2026, 2, 15, 12, 0)))
+    whiskers.add_task(Task(task_id="feed", title="Feed", due_datetime=datetime(2026, 2, 15, 9, 30)))
+    whiskers.add_task(Task(task_id="brush", title="Brush", due_datetime=datetime(2026, 2, 15, 18, 0)))
+    return system
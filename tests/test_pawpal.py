@@ -1,21 +1,16 @@
 from datetime import datetime, date, timedelta
+import copy
+import dataclasses
+from itertools import islice
+import pickle
 
 import pytest
 
-from pawpal_system import PawPalSystem, Owner, Pet, Task, TaskStatus, Recurrence
+from pawpal_system import Owner, Pet, Task, TaskStatus, Recurrence, PawPalSystem
 
 
-def _make_system_with_owner_pet():
-    system = PawPalSystem()
-    owner = Owner(name="Taylor")
-    pet = Pet(name="Fido", species="Dog", age=4)
-    owner.add_pet(pet)
-    system.add_owner(owner)
-    return system, owner, pet
-
-
-def test_sorting_correctness_chronological_order():
-    system, owner, pet = _make_system_with_owner_pet()
+def test_sorting_correctness_chronological_order(sop):
+    system, owner, pet = sop
 
     # Add tasks out of order
     t1 = Task(task_id="t1", title="Afternoon", due_datetime=datetime(2026, 2, 15, 15, 0), priority=1)
@@ -33,8 +28,37 @@ def test_sorting_correctness_chronological_order():
     assert times == sorted(times)
 
 
-def test_recurrence_daily_creates_next_task_on_complete():
-    system, owner, pet = _make_system_with_owner_pet()
+def test_sort_tasks_breaks_ties_by_priority_and_puts_undated_last(sop):
+    system, owner, pet = sop
+    nine = datetime(2026, 2, 15, 9, 0)
+    low = Task(task_id="low", title="Brush", due_datetime=nine, priority=1)
+    high = Task(task_id="high", title="Meds", due_datetime=nine, priority=5)
+    early = Task(task_id="early", title="Walk", due_datetime=datetime(2026, 2, 15, 8, 0), priority=1)
+    undated = Task(task_id="undated", title="Groom", priority=5)
+    same_a = Task(task_id="a", title="Feed", due_datetime=nine, priority=3)
+    same_b = Task(task_id="b", title="Play", due_datetime=nine, priority=3)
+
+    ordered = system.sort_tasks([undated, low, same_a, high, same_b, early])
+    assert ordered == [early, high, same_a, same_b, low, undated]
+    # stable: equal (time, priority) keep their input order
+    assert system.sort_tasks([same_b, same_a]) == [same_b, same_a]
+
+
+def test_time_str_formats_due_time_and_placeholder(sop):
+    system, owner, pet = sop
+    walk = Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 5))
+    pet.add_task(walk)
+    assert walk.time_str() == "09:05"
+    assert Task(title="Groom").time_str() == "--:--"
+
+    pet.reschedule_task("walk", due_datetime=datetime(2026, 2, 15, 18, 30))
+    assert walk.time_str() == "18:30"
+    pet.reschedule_task("walk", due_datetime=None)
+    assert walk.time_str() == "--:--"
+
+
+def test_recurrence_daily_creates_next_task_on_complete(sop):
+    system, owner, pet = sop
 
     base_dt = datetime(2026, 2, 15, 9, 0)
     daily = Task(
@@ -61,8 +85,8 @@ def test_recurrence_daily_creates_next_task_on_complete():
     assert matching[0].status == TaskStatus.PENDING
 
 
-def test_conflict_detection_flags_duplicate_times():
-    system, owner, pet = _make_system_with_owner_pet()
+def test_conflict_detection_flags_duplicate_times(sop):
+    system, owner, pet = sop
 
     dt = datetime(2026, 2, 15, 9, 0)
     a = Task(task_id="a", title="Walk", due_datetime=dt, priority=2)
@@ -78,11 +102,367 @@ def test_conflict_detection_flags_duplicate_times():
     assert ("a", "b") in flat or ("b", "a") in flat
 
 
-def test_pet_with_no_tasks_returns_empty_list():
-    system, owner, pet = _make_system_with_owner_pet()
+def test_pet_with_no_tasks_returns_empty_list(sop):
+    system, owner, pet = sop
     # Remove any tasks if present
     pet.tasks.clear()
 
     tasks_today = system.get_todays_tasks(date(2026, 2, 15))
     assert tasks_today == []
 
+
+def test_conflict_detection_uses_task_durations(seeded_system):
+    conflicts = seeded_system.detect_conflicts(date(2026, 2, 15))
+    flat = [(x.task_id, y.task_id) for x, y in conflicts]
+    # the hour-long walk overlaps both 09:30 tasks; play at 12:00 overlaps nothing
+    assert flat == [("walk", "meds"), ("walk", "feed"), ("meds", "feed"), ("dinner", "brush")]
+
+
+def test_iter_conflicts_yields_earliest_first_and_stops_early(seeded_system):
+    day = date(2026, 2, 15)
+    pairs = seeded_system.iter_conflicts(day)
+    # a generator: nothing is computed until asked for
+    assert iter(pairs) is pairs
+
+    first_two = list(islice(pairs, 2))
+    assert first_two == seeded_system.detect_conflicts(day)[:2]
+    # the rest is still there for a caller that keeps going
+    assert first_two + list(pairs) == seeded_system.detect_conflicts(day)
+
+    # ordered by the later task's start
+    starts = [later.due_datetime for _, later in seeded_system.iter_conflicts(day)]
+    assert starts == sorted(starts)
+
+
+def test_todays_tasks_reflect_tasks_added_after_a_query(sop):
+    system, owner, pet = sop
+    day = date(2026, 2, 15)
+
+    pet.add_task(Task(task_id="first", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0)))
+    assert [t.task_id for t in system.get_todays_tasks(day)] == ["first"]
+
+    pet.add_task(Task(task_id="second", title="Feed", due_datetime=datetime(2026, 2, 15, 18, 0)))
+    assert [t.task_id for t in system.get_todays_tasks(day)] == ["first", "second"]
+
+
+def test_pet_and_task_lookups_track_removals(sop):
+    system, owner, pet = sop
+    pet.add_task(Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0)))
+
+    assert pet.get_task("walk") is not None
+    assert pet.remove_task("walk") is True
+    assert pet.get_task("walk") is None
+    assert pet.remove_task("walk") is False
+
+    assert owner.get_pet_by_id(pet.pet_id) is pet
+    assert owner.remove_pet("Fido") is True
+    assert owner.get_pet("Fido") is None
+    owner.add_pet(Pet(name="Fido", species="Dog", age=5))
+    assert owner.get_pet("Fido").age == 5
+
+
+def test_lookups_follow_same_length_edits_and_duplicate_ids(sop):
+    system, owner, pet = sop
+    a = Task(task_id="a", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0))
+    b = Task(task_id="b", title="Feed", due_datetime=datetime(2026, 2, 15, 18, 0))
+    pet.add_task(a)
+    assert pet.get_task("a") is a
+
+    # same length before and after: the indexes must still follow the hook
+    pet.tasks[0] = b
+    pet.tasks_changed()
+    assert pet.get_task("a") is None
+    assert pet.remove_task("a") is False
+    pet.tasks.remove(b)
+    pet.tasks.append(a)
+    pet.tasks_changed()
+    system.mark_task_complete(owner.name, pet.name, "a")
+    assert a.status == TaskStatus.DONE
+
+    owner.pets[0] = Pet(name="Rex", species="Dog", age=2)
+    owner.pets_changed()
+    assert owner.get_pet("Rex") is owner.pets[0]
+    assert owner.get_pet("Fido") is None
+
+    # a repeated id: the first task wins, and removing it exposes the second
+    rex = owner.get_pet("Rex")
+    first = Task(task_id="dup", title="Walk")
+    second = Task(task_id="dup", title="Play")
+    rex.add_task(first)
+    rex.add_task(second)
+    assert rex.get_task("dup") is first
+    assert rex.remove_task("dup") is True
+    assert rex.get_task("dup") is second
+
+
+def test_exact_time_conflicts_reported_in_time_order(seeded_system):
+    warnings = seeded_system.detect_exact_time_conflicts(date(2026, 2, 15))
+    assert len(warnings) == 2
+    assert "09:30" in warnings[0] and "id=meds" in warnings[0] and "id=feed" in warnings[0]
+    assert "18:00" in warnings[1] and "id=dinner" in warnings[1] and "id=brush" in warnings[1]
+
+
+def test_owners_keyed_by_id_and_resolvable_by_name(sop):
+    system, owner, pet = sop
+
+    assert list(system.owners) == [owner.owner_id]
+    assert system.get_owner("Taylor") is owner
+    assert system.get_owner(owner.owner_id) is owner
+
+    task = Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0))
+    system.schedule_task(owner.owner_id, pet.pet_id, task)
+    assert pet.get_task("walk") is task
+
+    with pytest.raises(ValueError):
+        system.add_owner(Owner(name="Taylor"))
+
+
+def test_next_occurrence_skips_ahead_past_today():
+    base = datetime.combine(date.today() - timedelta(days=10), datetime.min.time()).replace(hour=8)
+    every_three_days = Task(due_datetime=base, recurrence=Recurrence(freq="daily", interval=3))
+    weekly = Task(due_datetime=base, recurrence=Recurrence(freq="weekly", interval=1))
+
+    # 10 days elapsed -> 3 full periods of 3 days, next is day 12
+    assert every_three_days.next_occurrence() == base + timedelta(days=12)
+    assert weekly.next_occurrence() == base + timedelta(weeks=2)
+
+
+def test_todays_tasks_come_back_in_time_order(seeded_system):
+    tasks_today = seeded_system.get_todays_tasks(date(2026, 2, 15))
+    # ties keep pet order: Fido's 09:30 meds before Whiskers' 09:30 feed
+    assert [t.task_id for t in tasks_today] == ["walk", "meds", "feed", "play", "dinner", "brush"]
+
+
+def test_completing_recurring_task_twice_spawns_one_occurrence(sop):
+    system, owner, pet = sop
+    base_dt = datetime(2026, 2, 15, 9, 0)
+    pet.add_task(Task(task_id="daily1", title="Daily walk", due_datetime=base_dt,
+                      recurrence=Recurrence(freq="daily", interval=1)))
+
+    system.mark_task_complete(owner.name, pet.name, "daily1")
+    system.mark_task_complete(owner.name, pet.name, "daily1")
+
+    next_day = base_dt + timedelta(days=1)
+    assert len([t for t in pet.tasks if t.due_datetime == next_day]) == 1
+    assert pet.find_task("Daily walk", next_day) is not None
+
+
+def test_recurrence_next_after_and_catch_up_use_the_interval():
+    every_two_days = Recurrence(freq="daily", interval=2)
+    monthly = Recurrence(freq="monthly")
+    start = datetime(2026, 1, 31, 9, 0)
+
+    assert every_two_days.next_after(start) == datetime(2026, 2, 2, 9, 0)
+    assert monthly.next_after(start) == datetime(2026, 2, 28, 9, 0)
+    assert Recurrence(freq="yearly").next_after(datetime(2028, 2, 29)) == datetime(2029, 2, 28)
+    assert {every_two_days, Recurrence(freq="daily", interval=2)} == {every_two_days}
+
+    # weeks away: jump straight to the first occurrence after now
+    assert every_two_days.catch_up(start, datetime(2026, 3, 1, 12, 0)) == datetime(2026, 3, 2, 9, 0)
+    assert monthly.catch_up(start, datetime(2026, 4, 15)) == datetime(2026, 4, 30, 9, 0)
+
+
+def test_clearing_tasks_directly_invalidates_cached_day(sop):
+    system, owner, pet = sop
+    pet.add_task(Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0)))
+    assert len(system.get_todays_tasks(date(2026, 2, 15))) == 1
+
+    pet.tasks.clear()
+    pet.tasks_changed()
+    assert system.get_todays_tasks(date(2026, 2, 15)) == []
+    assert pet.get_task("walk") is None
+
+
+def test_editing_a_task_moves_it_between_cached_days(sop):
+    system, owner, pet = sop
+    walk = Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0))
+    pet.add_task(walk)
+    assert system.get_todays_tasks(date(2026, 2, 15)) == [walk]
+    assert system.get_todays_tasks(date(2026, 2, 16)) == []
+
+    pet.reschedule_task("walk", due_datetime=datetime(2026, 2, 16, 9, 0))
+    assert system.get_todays_tasks(date(2026, 2, 15)) == []
+    assert system.get_todays_tasks(date(2026, 2, 16)) == [walk]
+    assert pet.find_task("Walk", datetime(2026, 2, 16, 9, 0)) is walk
+    assert pet.find_task("Walk", datetime(2026, 2, 15, 9, 0)) is None
+
+    # direct edits are picked up once the pet is told about them
+    walk.recurrence = Recurrence(freq="daily")
+    pet.tasks_changed()
+    assert system.get_todays_tasks(date(2026, 2, 17)) == [walk]
+
+    with pytest.raises(ValueError):
+        pet.reschedule_task("missing", title="Run")
+
+
+def test_day_view_matches_separate_queries(seeded_system):
+    day = date(2026, 2, 15)
+    view = seeded_system.day_view(day)
+
+    assert view.tasks == seeded_system.get_todays_tasks(day)
+    assert view.conflicts == seeded_system.detect_conflicts(day)
+    assert [t.due_datetime for t in view.tasks] == sorted(t.due_datetime for t in view.tasks)
+
+
+def test_tasks_and_pets_pickle_after_being_queried(sop):
+    system, owner, pet = sop
+    base = datetime(2026, 2, 15, 9, 0)
+    pet.add_task(Task(task_id="once", title="Vet", due_datetime=base))
+    pet.add_task(Task(task_id="daily", title="Walk", due_datetime=base,
+                      recurrence=Recurrence(freq="daily", interval=2)))
+    assert len(system.get_todays_tasks(date(2026, 2, 17))) == 1
+
+    copied = pickle.loads(pickle.dumps(owner))
+    copied_pet = copied.get_pet("Fido")
+    assert [t.task_id for t in copied_pet.tasks] == ["once", "daily"]
+    assert copied_pet.get_task("daily").is_due_on(date(2026, 2, 19))
+    assert not copied_pet.get_task("once").is_due_on(date(2026, 2, 17))
+    assert copied_pet.remove_task("once") is True
+    assert copied_pet.get_task("once") is None
+
+    # a fresh copy must index what is added to it, not go by stale state
+    for clone in (pickle.loads(pickle.dumps(owner)), copy.deepcopy(owner)):
+        clone.add_pet(Pet(name="Rex", species="Dog", age=2))
+        assert clone.get_pet("Rex") is clone.pets[-1]
+        clone_pet = clone.get_pet("Fido")
+        clone_pet.add_task(Task(task_id="late", title="Brush"))
+        assert clone_pet.get_task("late") is clone_pet.tasks[-1]
+    assert owner.get_pet("Rex") is None
+
+
+def test_direct_list_edits_are_picked_up_by_the_hooks(sop):
+    system, owner, pet = sop
+    day = date(2026, 2, 15)
+    walk = Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0))
+    pet.add_task(walk)
+    assert system.get_todays_tasks(day) == [walk]
+
+    mine = []
+    pet.tasks = mine
+    pet.tasks_changed()
+    assert system.get_todays_tasks(day) == []
+    assert pet.get_task("walk") is None
+    # the pet keeps the caller's list, so later edits to it count too
+    mine += [walk]
+    pet.tasks_changed()
+    assert pet.tasks is mine
+    assert pet.get_task("walk") is walk
+    assert system.get_todays_tasks(day) == [walk]
+
+    owner.pets = [Pet(name="Rex", species="Dog", age=2)]
+    owner.pets_changed()
+    assert system.get_todays_tasks(day) == []
+    assert owner.get_pet("Rex") is owner.pets[0]
+
+
+def test_cached_days_follow_only_their_own_system(sop, monkeypatch):
+    system, owner, pet = sop
+    day = date(2026, 2, 15)
+    walk = Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0),
+                duration=timedelta(minutes=60))
+    meds = Task(task_id="meds", title="Meds", due_datetime=datetime(2026, 2, 15, 9, 30))
+    pet.add_task(walk)
+    pet.add_task(meds)
+
+    # count how often the conflicts are actually computed
+    computed = []
+    iter_conflicts = system.iter_conflicts
+    monkeypatch.setattr(system, "iter_conflicts", lambda d: computed.append(d) or iter_conflicts(d))
+    assert system.detect_conflicts(day) == [(walk, meds)]
+    assert computed == [day]
+
+    # edits under another system, and completing a task, keep this day cached
+    other = PawPalSystem()
+    rex = Pet(name="Rex", species="Dog", age=2)
+    other.add_owner(Owner(name="Sam", pets=[rex]))
+    feed = Task(task_id="feed", title="Feed", due_datetime=datetime(2026, 2, 15, 9, 0))
+    rex.add_task(feed)
+    assert other.get_todays_tasks(day) == [feed]
+    rex.reschedule_task("feed", title="Breakfast")
+    system.mark_task_complete(owner.name, pet.name, "walk")
+    assert system.get_todays_tasks(day) == [walk, meds]
+    assert system.detect_conflicts(day) == [(walk, meds)]
+    assert computed == [day]
+
+    # an edit under this system is recomputed
+    pet.remove_task("meds")
+    assert system.detect_conflicts(day) == []
+    assert computed == [day, day]
+
+    del system.owners[owner.owner_id]
+    system.owners_changed()
+    assert system.get_todays_tasks(day) == []
+    assert system.get_owner("Taylor") is None
+    system.add_owner(owner)
+    assert system.get_todays_tasks(day) == [walk]
+
+
+def test_lookups_follow_reassigned_ids_and_names(sop):
+    system, owner, pet = sop
+    walk = Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0))
+    pet.add_task(walk)
+    assert pet.get_task("walk") is walk
+
+    pet.reschedule_task("walk", task_id="morning-walk")
+    assert pet.get_task("walk") is None
+    system.mark_task_complete(owner.name, pet.name, "morning-walk")
+    assert walk.status == TaskStatus.DONE
+
+    pet.name = "Rex"
+    pet.pet_id = "rex"
+    owner.pets_changed()
+    assert owner.get_pet("Fido") is None
+    assert owner.get_pet("Rex") is pet
+    assert owner.get_pet_by_id("rex") is pet
+    owner.add_pet(Pet(name="Fido", species="Dog", age=1))
+    with pytest.raises(ValueError):
+        owner.add_pet(Pet(name="Rex", species="Cat", age=3))
+
+    owner.name = "Jordan"
+    system.owners_changed()
+    assert system.get_owner("Taylor") is None
+    assert system.get_owner("Jordan") is owner
+
+
+def test_back_references_stay_out_of_asdict(sop):
+    system, owner, pet = sop
+    pet.add_task(Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0)))
+    system.get_todays_tasks(date(2026, 2, 15))
+
+    assert dataclasses.asdict(owner)["pets"][0]["tasks"][0]["task_id"] == "walk"
+    assert dataclasses.astuple(pet)[0] == "Fido"
+
+
+def test_only_public_data_are_dataclass_fields(sop):
+    system, owner, pet = sop
+    walk = Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 9, 0))
+    pet.add_task(walk)
+    system.get_todays_tasks(date(2026, 2, 15))
+    walk.time_str()
+
+    for obj in (walk, pet, owner):
+        assert not [f.name for f in dataclasses.fields(obj) if f.name.startswith("_")]
+    assert pet == copy.deepcopy(pet)
+
+
+def test_in_place_updates_keep_walk_order_for_equal_times(sop):
+    system, owner, pet = sop
+    whiskers = Pet(name="Whiskers", species="Cat", age=3)
+    owner.add_pet(whiskers)
+    day = date(2026, 2, 15)
+    nine = datetime(2026, 2, 15, 9, 0)
+    assert system.get_todays_tasks(day) == []
+
+    feed = Task(task_id="feed", title="Feed", due_datetime=nine)
+    whiskers.add_task(feed)
+    walk = Task(task_id="walk", title="Walk", due_datetime=datetime(2026, 2, 15, 8, 0))
+    pet.add_task(walk)
+    meds = Task(task_id="meds", title="Meds", due_datetime=nine)
+    pet.add_task(meds)
+    assert system.get_todays_tasks(day) == [walk, meds, feed]
+
+    # rescheduling keeps a task's place among equal times
+    pet.reschedule_task("walk", due_datetime=nine)
+    assert system.get_todays_tasks(day) == [walk, meds, feed]
+    pet.remove_task("meds")
+    assert system.get_todays_tasks(day) == [walk, feed]